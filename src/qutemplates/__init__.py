@@ -1,13 +1,27 @@
-# from .base import Template
-from .export import save_all
-from .opx import (
-    CachingOpxHandler,
-    DefaultOpxHandler,
-    # InteractiveOPX,
-    OPXContext,
-    SnapshotOPX,
-    # StreamingOPX,
-)
+from typing import TYPE_CHECKING
+
+from .common.lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .export import save_all
+    from .opx import (
+        CachingOpxHandler,
+        DefaultOpxHandler,
+        OPXContext,
+        SnapshotOPX,
+    )
+
+# Public names resolved lazily (PEP 562) so `import qutemplates` does not pull
+# in the QM SDK / matplotlib stack until a symbol is actually used.
+_LAZY_IMPORTS = {
+    "SnapshotOPX": ".opx",
+    # "StreamingOPX": ".opx",
+    # "InteractiveOPX": ".opx",
+    "OPXContext": ".opx",
+    "CachingOpxHandler": ".opx",
+    "DefaultOpxHandler": ".opx",
+    "save_all": ".export",
+}
 
 __all__ = [
     "SnapshotOPX",
@@ -18,3 +32,5 @@ __all__ = [
     "DefaultOpxHandler",
     "save_all",
 ]
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_IMPORTS, __all__)
@@ -11,10 +11,23 @@ Available Tasks:
     - ProgressTask: tqdm-based progress bar with polling
 """
 
-from .live_animation_task import LiveAnimationTask
-from .progress_task import ProgressTask
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .live_animation_task import LiveAnimationTask
+    from .progress_task import ProgressTask
+
+# Resolved lazily (PEP 562) so using ProgressTask does not import matplotlib
+_LAZY_IMPORTS = {
+    "LiveAnimationTask": ".live_animation_task",
+    "ProgressTask": ".progress_task",
+}
 
 __all__ = [
     "LiveAnimationTask",
     "ProgressTask",
 ]
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_IMPORTS, __all__)
@@ -0,0 +1,36 @@
+"""Lazy (PEP 562) attribute exports for package __init__ modules."""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_module_attrs(
+    package: str, lazy_imports: dict[str, str], names: list[str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level __getattr__ and __dir__ for lazy exports.
+
+    Args:
+        package: __name__ of the package doing the exporting
+        lazy_imports: Public name -> relative module that defines it
+        names: The package's __all__
+
+    Usage:
+        >>> __getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_IMPORTS, __all__)
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(module_name, package), name)
+        # Cache on the module so __getattr__ only fires once per name
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return list(names)
+
+    return __getattr__, __dir__
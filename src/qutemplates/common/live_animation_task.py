@@ -8,6 +8,7 @@ workflow systems.
 
 import pathlib
 from collections.abc import Callable
+from functools import cache
 from typing import TypeVar
 
 import matplotlib.pyplot as plt
@@ -16,16 +17,33 @@ from matplotlib.artist import Artist
 from matplotlib.figure import Figure
 from matplotlib.text import Text
 from matplotlib.widgets import Button
-from PyQt6.QtCore import QTimer
 from quflow import Task, TaskContext
 from quflow.status import Status
 
-# Load button icons from resources
+# Button icons from resources, decoded on first use (see _load_icon)
 dir_path = pathlib.Path(__file__).parent.absolute()
 RESOURCES = dir_path / "resources"
-STOP_ICON = plt.imread(str(RESOURCES / "stop_icon.png"))
-SAVE_ICON = plt.imread(str(RESOURCES / "save_icon.png"))
-REJECT_ICON = plt.imread(str(RESOURCES / "reject_icon.png"))
+STOP_ICON_FILE = "stop_icon.png"
+SAVE_ICON_FILE = "save_icon.png"
+REJECT_ICON_FILE = "reject_icon.png"
+
+# STOP_ICON / SAVE_ICON / REJECT_ICON keep their full-resolution image arrays,
+# read on first attribute access (PEP 562) instead of at import
+_ICON_FILES = {
+    "STOP_ICON": STOP_ICON_FILE,
+    "SAVE_ICON": SAVE_ICON_FILE,
+    "REJECT_ICON": REJECT_ICON_FILE,
+}
+
+
+def __getattr__(name: str):
+    filename = _ICON_FILES.get(name)
+    if filename is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = globals()[name] = plt.imread(str(RESOURCES / filename))
+    return value
+
 
 T = TypeVar("T")
 
@@ -34,10 +52,28 @@ CleanupFuncType = Callable[[tuple[Figure, list[Artist]]], None]
 UpdateFuncType = Callable[[list[Artist], T], list[Artist]]
 
 
+ICON_MAX_PX = 80  # roughly BTN_SIZE_IN at screen dpi; larger icons are decimated
+
+
+@cache
+def _load_icon(filename: str):
+    """Read a button icon image once, on first button creation.
+
+    The image is decimated to about ICON_MAX_PX pixels per side so matplotlib
+    does not resample the full-resolution resource on every redraw.
+    """
+    icon = plt.imread(str(RESOURCES / filename))
+    step = max(1, icon.shape[0] // ICON_MAX_PX, icon.shape[1] // ICON_MAX_PX)
+    return icon[::step, ::step]
+
+
 BTN_SIZE_IN = 0.8  # physical size in inches -> consistent on screen
 BTN_Y = 0.90
 BTN_MARGIN = 0.02
 
+AVG_TEXT_W = 0.25  # figure-fraction box hosting the "n=X/Y" counter
+AVG_TEXT_H = 0.06
+
 
 class LiveAnimationTask(Task):
     """
@@ -56,6 +92,8 @@ class LiveAnimationTask(Task):
                 Called repeatedly to update plot with new data.
         refresh_time_sec: Interval between animation frames in seconds.
                          Defaults to 0.05 (20 FPS).
+        blit: Redraw only the artists returned by update each frame instead of
+              the whole canvas. Defaults to False (see Note).
         cleanup_func: Optional cleanup routine called after animation stops.
         stop_callable: Function returning bool indicating if animation should stop.
                       Checked on each frame. Defaults to never stop.
@@ -84,16 +122,43 @@ class LiveAnimationTask(Task):
         This task should be run in the main thread (run_in_main_thread=True)
         to avoid concurrency issues with matplotlib.
 
+        With blit=True only the artists returned by update are redrawn each
+        frame. update must then mutate existing artists (set_data, set_ydata,
+        ...) rather than create new ones, and axis limits should be fixed in
+        setup_func since axes decorations (ticks, labels) are not redrawn per
+        frame. Leave blit off if update autoscales.
+
         Data is read via context.read_callable() which should be set up
         by the workflow system to provide the data channel.
     """
 
+    __slots__ = (
+        "_artists",
+        "_buttons",
+        "_context",
+        "_continue_button",
+        "_figure",
+        "_last_avg",
+        "_max_avg_str",
+        "_stop_button",
+        "_text_artist_for_avg",
+        "animation",
+        "blit",
+        "current_avg_callable",
+        "exception",
+        "max_avg",
+        "refresh_time_ms",
+        "setup_func",
+        "update",
+    )
+
     def __init__(
         self,
         *,
         setup_func: SetupFuncType,
         update: UpdateFuncType,
         refresh_time_sec: float = 0.05,
+        blit: bool = False,
         current_avg_callable: Callable[[], int] | None = None,
         max_avg: int | None = None,
     ):
@@ -102,10 +167,13 @@ class LiveAnimationTask(Task):
         self.setup_func = setup_func
         self.current_avg_callable = current_avg_callable
         self.max_avg = max_avg
+        # max_avg is fixed, so format it once instead of on every frame
+        self._max_avg_str = f"{max_avg:g}" if max_avg is not None else "?"
 
         # Animation state
         self.animation = None
         self.refresh_time_ms: int = int(refresh_time_sec * 1000)
+        self.blit = blit
         self.exception = None
         self._figure: Figure | None = None
         self._artists: list[Artist] | None = None
@@ -118,6 +186,7 @@ class LiveAnimationTask(Task):
         self._stop_button = None
         self._continue_button = None
         self._text_artist_for_avg: Text | None = None
+        self._last_avg: int = -1
 
     @property
     def figure(self) -> Figure:
@@ -138,46 +207,52 @@ class LiveAnimationTask(Task):
             raise ValueError("Please make sure the run set the context correctly")
         return self._context
 
-    def update_average(self) -> tuple:
+    def update_average(self) -> Text | None:
         """
         Update the average counter text display.
 
         Returns:
-            Tuple containing the text artist if averager is enabled, empty tuple otherwise.
+            The text artist if averager is enabled, None otherwise.
         """
         if self._text_artist_for_avg is None or self.current_avg_callable is None:
-            return ()
+            return None
 
         current_avg = self.current_avg_callable()
-        max_avg = self.max_avg
 
-        if current_avg and max_avg:
-            text = self._get_averager_text_formatter(current_avg, max_avg)
-            self._text_artist_for_avg.set_text(text)
+        # Averaging advances far slower than the frame rate; skip the redundant set_text
+        if current_avg == self._last_avg:
+            return self._text_artist_for_avg
+        self._last_avg = current_avg
+
+        if current_avg and self.max_avg:
+            self._text_artist_for_avg.set_text(f"n={current_avg}/{self._max_avg_str}")
 
-        return (self._text_artist_for_avg,)
+        return self._text_artist_for_avg
 
     def stop_from_animation(self):
-        """Stop animation and close figure (called from animation loop)."""
-        QTimer.singleShot(0, lambda: plt.close(self.figure))
+        """Stop animation and close figure (called from animation loop).
 
-    @staticmethod
-    def _get_averager_text_formatter(curr_avg=None, max_avg=None):
-        """Format average counter text."""
-        if curr_avg is None or max_avg is None:
-            return "n=?/?"
-        return f"n={curr_avg}/{max_avg:g}"
+        step() runs on the GUI thread under FuncAnimation, so the figure is
+        closed synchronously rather than posted back to the Qt event loop.
+        """
+        self._stop_and_close()
 
     def _setup_averager_artist(self) -> Text:
-        """Create text artist for displaying average counter."""
-        text = self._get_averager_text_formatter()
-        return self.figure.text(
+        """Create text artist for displaying average counter.
+
+        The text lives on a small overlay axes (rather than the figure) so it
+        can take part in blitting, which only handles axes-bound artists.
+        """
+        ax = self.figure.add_axes((1.0 - AVG_TEXT_W, 1.0 - AVG_TEXT_H, AVG_TEXT_W, AVG_TEXT_H))
+        ax.set_axis_off()
+        return ax.text(
             x=1.0,
             y=1.0,
-            s=text,
+            s="n=?/?",
             fontsize="large",
             horizontalalignment="right",
             verticalalignment="top",
+            transform=ax.transAxes,
         )
 
     def setup(self):
@@ -209,9 +284,13 @@ class LiveAnimationTask(Task):
             fig=self.figure,
             func=self.step,
             interval=self.refresh_time_ms,
-            blit=False,
-            repeat=True,
-            frames=200,
+            blit=self.blit,
+            # Open-ended live data: infinite frame counter, no wrap-around and
+            # no per-frame data cache kept by matplotlib
+            frames=None,
+            repeat=False,
+            cache_frame_data=False,
+            save_count=0,
         )
 
         # This blocks until the figure is closed
@@ -237,8 +316,11 @@ class LiveAnimationTask(Task):
 
     def stop_from_button(self):
         """Stop animation and close figure (called from button click)."""
-        # Stop the animation's event source
-        if self.animation is not None:
+        self._stop_and_close()
+
+    def _stop_and_close(self):
+        # Stop the animation's event source (already None if the figure was closed)
+        if self.animation is not None and self.animation.event_source is not None:
             self.animation.event_source.stop()
 
         # Close the figure so that plt.show() returns
@@ -259,7 +341,7 @@ class LiveAnimationTask(Task):
         self.context.status = Status.REJECT
         self.stop_from_button()
 
-    def _add_icon_button(self, x, icon, callback):
+    def _add_icon_button(self, x, icon_file, callback):
         fig = self.figure
         fw, fh = fig.get_size_inches()
 
@@ -270,15 +352,15 @@ class LiveAnimationTask(Task):
         ax = fig.add_axes((x, BTN_Y, w, h))
         ax.set_axis_off()
 
-        btn = Button(ax, "", image=icon)
+        btn = Button(ax, "", image=_load_icon(icon_file))
         btn.on_clicked(callback)
         self._buttons.append(btn)
 
     def add_stop_button(self):
-        self._add_icon_button(0.10, STOP_ICON, self.stop_when_button_pressed)
+        self._add_icon_button(0.10, STOP_ICON_FILE, self.stop_when_button_pressed)
 
     def add_reject_button(self):
-        self._add_icon_button(0.20, REJECT_ICON, self.reject_when_button_pressed)
+        self._add_icon_button(0.20, REJECT_ICON_FILE, self.reject_when_button_pressed)
 
     def add_continue_button(self):
         # place from the right edge so it never gets squeezed
@@ -286,7 +368,7 @@ class LiveAnimationTask(Task):
         fw, _ = fig.get_size_inches()
         w = BTN_SIZE_IN / fw
         x = 1.0 - BTN_MARGIN - w
-        self._add_icon_button(x, SAVE_ICON, self.continue_when_button_pressed)
+        self._add_icon_button(x, SAVE_ICON_FILE, self.continue_when_button_pressed)
 
     def step(self, frame):
         """
@@ -298,31 +380,40 @@ class LiveAnimationTask(Task):
             frame: Frame number (provided by FuncAnimation)
 
         Returns:
-            Tuple of artists that were updated (for blitting)
+            Iterable of artists that were updated (for blitting), always
+            including the averager text. When no new data arrived, the
+            unchanged artists from setup are returned.
         """
 
+        ctx = self.context
         artists = self.artists
 
-        try:
-            # Check stop conditions
-            if self.context.interrupt.is_set():
-                self.stop_from_animation()
+        # Check stop conditions
+        if ctx.interrupt.is_set():
+            self.stop_from_animation()
+            return self._with_average_text(artists)
 
+        try:
             # Read new data from channel
-            data = self.context.read_callable()
-
-            if data is not None:
-                # Update artists with new data
-                artists = self.update(self.artists, data)
-                # Update average counter if enabled
-                text_artist_as_tuple = self.update_average()
-                artists = (*artists, *text_artist_as_tuple)
-
+            data = ctx.read_callable()
+            if data is None:
+                return self._with_average_text(artists)
+
+            # Update artists with new data
+            updated = self.update(artists, data)
+            # Update average counter if enabled
+            self.update_average()
         except Exception as e:
             # Store exception and stop animation
             self.exception = e
             self.stop_from_animation()
-            self.context.interrupt.set()
+            ctx.interrupt.set()
+            return self._with_average_text(artists)
+
+        return self._with_average_text(updated)
 
-        # Return all artists for blitting
-        return artists
+    def _with_average_text(self, artists: list[Artist]) -> list[Artist]:
+        """Add the averager text so blitting redraws it on every frame."""
+        if self._text_artist_for_avg is None:
+            return artists
+        return [*artists, self._text_artist_for_avg]
@@ -61,18 +61,27 @@ class ProgressTask(Task):
         get_current: Callable[[], int | float],
         total: int,
         title: str = "Progress",
+        refresh_interval: float = 0.1,
     ):
         # User-provided callbacks (dependency injection)
         self.get_current = get_current
         self.total: int = total
         self.title = title
+        self.refresh_interval = refresh_interval
 
         # Progress bar (created during execution)
         self._pbar: tqdm | None = None
 
     def setup(self):
-        # Create progress bar
-        self._pbar = tqdm(total=self.total, desc=self.title)
+        # Create progress bar. Redraws are throttled to 4/sec and to 0.1% steps
+        # of the total so frequent polling does not flood the terminal.
+        self._pbar = tqdm(
+            total=self.total,
+            desc=self.title,
+            mininterval=0.25,
+            miniters=max(1, self.total // 1000),
+            smoothing=0.1,
+        )
 
     def cleanup(self):
         if self._pbar is not None:
@@ -86,18 +95,27 @@ class ProgressTask(Task):
         return self._pbar
 
     def update(self):
+        pbar = self.pbar
+
+        # Bar is already full - no need to poll the callback anymore
+        if pbar.n >= self.total:
+            return
+
         # Get current progress
         # Let exceptions propagate - don't catch them
         current = self.get_current()
 
-        extra = current - self.pbar.n
+        extra = current - pbar.n
         if extra > 0:  # No new data - skip the post_run() and the plot up
-            self.pbar.update(extra)
+            pbar.update(extra)
 
     def run(self, ctx: TaskContext):
         self.setup()
 
-        while not ctx.interrupt.is_set():
-            self.update()
-
-        self.cleanup()
+        try:
+            # The interrupt event doubles as the pacing primitive: wait() returns
+            # True as soon as it is set, otherwise blocks for refresh_interval.
+            while not ctx.interrupt.wait(self.refresh_interval):
+                self.update()
+        finally:
+            self.cleanup()
@@ -1,5 +1,5 @@
 from .registry import Artifact, ArtifactKind, ArtifactRegistry
-from .save import save_all, save_py_by_dir_or_path_with_timestamp
+from .save import save_all, save_py_by_dir_or_path_with_timestamp, wait_for_pending_saves
 
 __all__ = [
     "ArtifactKind",
@@ -7,4 +7,5 @@ __all__ = [
     "ArtifactRegistry",
     "save_all",
     "save_py_by_dir_or_path_with_timestamp",
+    "wait_for_pending_saves",
 ]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import ItemsView
+from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from typing import Any
 
@@ -15,13 +16,37 @@ class ArtifactKind(StrEnum):
     FIGURE = auto()  # matplotlib Figure
 
 
-@dataclass
+# Exact types whose kind is known without inspecting the payload
+_KIND_BY_TYPE: dict[type, ArtifactKind] = {
+    dict: ArtifactKind.JSON,
+    list: ArtifactKind.JSON,
+    tuple: ArtifactKind.JSON,
+    int: ArtifactKind.JSON,
+    float: ArtifactKind.JSON,
+    bool: ArtifactKind.JSON,
+    type(None): ArtifactKind.JSON,
+}
+
+# File extension each kind is saved with
+_EXTENSION_BY_KIND: dict[ArtifactKind, str] = {
+    ArtifactKind.JSON: "json",
+    ArtifactKind.PY: "py",
+    ArtifactKind.FIGURE: "png",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Artifact:
     """Single artifact with payload and metadata."""
 
     payload: Any
     kind: ArtifactKind
     save_hint: str | None = None
+    extension: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # frozen - bypass the dataclass __setattr__ guard
+        object.__setattr__(self, "extension", _EXTENSION_BY_KIND[self.kind])
 
 
 class ArtifactRegistry:
@@ -38,18 +63,25 @@ class ArtifactRegistry:
         save_hint: str | None = None,
     ) -> None:
         """Register artifact. Kind is inferred if not provided."""
-        if key in self._artifacts:
-            raise ValueError(f"Key already registered: {key}")
+        if kind is None:
+            kind = self._infer_kind(data)
+        artifact = Artifact(payload=data, kind=kind, save_hint=save_hint)
 
-        resolved_kind = kind if kind is not None else self._infer_kind(data)
-        self._artifacts[key] = Artifact(payload=data, kind=resolved_kind, save_hint=save_hint)
+        # setdefault inserts and reports an existing entry in a single lookup
+        if self._artifacts.setdefault(key, artifact) is not artifact:
+            raise ValueError(f"Key already registered: {key}")
 
     def _infer_kind(self, data: Any) -> ArtifactKind:
         """Infer artifact kind from data type."""
+        kind = _KIND_BY_TYPE.get(type(data))
+        if kind is not None:
+            return kind
+        if isinstance(data, str):
+            if "def " in data or "import " in data:
+                return ArtifactKind.PY
+            return ArtifactKind.JSON
         if hasattr(data, "savefig"):
             return ArtifactKind.FIGURE
-        if isinstance(data, str) and ("def " in data or "import " in data):
-            return ArtifactKind.PY
         return ArtifactKind.JSON
 
     def get(self, key: str) -> Artifact | None:
@@ -60,9 +92,9 @@ class ArtifactRegistry:
         """Check if key exists."""
         return key in self._artifacts
 
-    def items(self) -> list[tuple[str, Artifact]]:
-        """Return all artifacts as key-value pairs."""
-        return list(self._artifacts.items())
+    def items(self) -> ItemsView[str, Artifact]:
+        """Return a live view of all artifacts as key-value pairs."""
+        return self._artifacts.items()
 
     def reset(self) -> None:
         """Clear all artifacts."""
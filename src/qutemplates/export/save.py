@@ -2,12 +2,56 @@
 
 from __future__ import annotations
 
+import atexit
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from matplotlib.figure import Figure
+import numpy as np
 
-from .registry import ArtifactKind, ArtifactRegistry
-from .utils import add_time_stamp, generate_unique_save_name, save_dict, save_fig, time_stamp
+from .registry import Artifact, ArtifactKind, ArtifactRegistry
+from .utils import (
+    DELIMITER,
+    add_time_stamp,
+    generate_unique_save_name,
+    make_save_path,
+    render_fig,
+    save_dict,
+    save_fig,
+    time_stamp,
+)
+
+if TYPE_CHECKING:
+    # Annotation only - matplotlib is imported by whoever created the figures
+    from matplotlib.figure import Figure
+
+_logger = logging.getLogger(__name__)
+
+# Single background writer used by save_all(background=True)
+_writer: ThreadPoolExecutor | None = None
+# Queued or failed writes; successful ones drop out as soon as they finish
+_pending: set[Future] = set()
+_pending_lock = threading.Lock()
+# Paths of queued background writes whose files do not exist yet
+_reserved_paths: set[Path] = set()
+
+
+def _write_py(path: Path, content: str) -> None:
+    path.write_text(content)
+
+
+# Writer for each artifact kind. Paths come from _claim_path, which already
+# checked they are free.
+SAVE_FN: dict[ArtifactKind, Callable[[Path, Any], None]] = {
+    ArtifactKind.JSON: partial(save_dict, skip_check=True),
+    ArtifactKind.PY: _write_py,
+    ArtifactKind.FIGURE: partial(save_fig, skip_check=True),
+}
 
 
 def save_all(
@@ -16,12 +60,26 @@ def save_all(
     name: str,
     timestamp: str | None = None,
     figures: Figure | list[Figure] | None = None,
+    background: bool = False,
+    arrays_to_npz: bool = False,
+    tight_figures: bool = True,
 ) -> Path:
     """Save all artifacts from registry to disk.
 
     JSON artifacts (data, parameters, etc.) are combined into a single file.
     PY and FIGURE artifacts are saved as separate files.
 
+    With background=True files are written by a background thread so the caller
+    can start the next experiment right away. Figures are still rendered on the
+    calling thread since matplotlib is not thread-safe; only writing the encoded
+    image is deferred. Payloads must not be mutated until
+    wait_for_pending_saves() returns.
+
+    With arrays_to_npz=True numpy arrays inside JSON artifacts (top level or in
+    nested dicts) are written raw to a separate {name}_arrays_{timestamp}.npz
+    instead of being encoded as JSON lists; the JSON keeps an "npz:<file>#<key>"
+    placeholder naming the npz file and the array's key in it.
+
     Args:
         registry: ArtifactRegistry containing artifacts to save.
         path: Directory path where files should be saved.
@@ -29,9 +87,13 @@ def save_all(
         timestamp: Optional timestamp string. Generated if not provided.
         figures: Optional figure(s) to register and save. Convenience parameter
             that registers figures into the registry before saving.
+        background: Write files asynchronously (see above).
+        arrays_to_npz: Store arrays from JSON artifacts in an npz file (see above).
+        tight_figures: Crop figures to their content (bbox_inches="tight").
+            Disable to skip the extra layout pass on large figures.
 
     Returns:
-        Path to the saved JSON file.
+        Path to the saved JSON file (may still be pending when background=True).
     """
     if figures is not None:
         figs = [figures] if not isinstance(figures, list) else figures
@@ -43,42 +105,131 @@ def save_all(
     directory = Path(path)
     directory.mkdir(parents=True, exist_ok=True)
 
-    # Collect all JSON artifacts into one dict
-    json_data = {
-        key: artifact.payload
-        for key, artifact in registry.items()
-        if artifact.kind == ArtifactKind.JSON
-    }
+    # Collect all JSON artifacts into one dict, the rest are saved one per file
+    json_data: dict[str, Any] = {}
+    separate: list[tuple[str, Artifact]] = []
+    for key, artifact in registry.items():
+        if artifact.kind is ArtifactKind.JSON:
+            json_data[key] = artifact.payload
+        else:
+            separate.append((key, artifact))
+
+    if arrays_to_npz:
+        npz_path: Path | None = None
+
+        def npz_ref(key: str) -> str:
+            # Claimed on the first array, so saves without arrays write no npz
+            nonlocal npz_path
+            if npz_path is None:
+                npz_path = _claim_path(directory, f"{name}_arrays_{timestamp}", "npz", background)
+            return f"npz:{npz_path.name}#{key}"
+
+        json_data, arrays = _split_arrays(json_data, npz_ref)
+        if npz_path is not None:
+            _write(background, npz_path, partial(np.savez, npz_path, **arrays))
 
     # Save combined JSON
-    path_iter = generate_unique_save_name(str(directory), name, "data", timestamp, "json")
-    json_path = next(path_iter)
-    save_dict(json_path, json_data)
+    json_path = _claim_path(directory, f"{name}_data_{timestamp}", "json", background)
+    _write(background, json_path, SAVE_FN[ArtifactKind.JSON], json_path, json_data)
 
     # Save non-JSON artifacts individually
-    for key, artifact in registry.items():
-        if artifact.kind == ArtifactKind.PY:
-            _save_py(artifact.payload, artifact.save_hint or key, directory, name, timestamp)
-        elif artifact.kind == ArtifactKind.FIGURE:
-            _save_figure(artifact.payload, artifact.save_hint or key, directory, name, timestamp)
+    for key, artifact in separate:
+        stem = f"{name}_{artifact.save_hint or key}_{timestamp}"
+        file_path = _claim_path(directory, stem, artifact.extension, background)
+        if artifact.kind is ArtifactKind.FIGURE:
+            if background:
+                # Render here, hand only the disk write to the writer thread
+                png = render_fig(artifact.payload, artifact.extension, tight=tight_figures)
+                _write(True, file_path, file_path.write_bytes, png)
+            else:
+                save_fig(file_path, artifact.payload, tight=tight_figures, skip_check=True)
+        else:
+            _write(background, file_path, SAVE_FN[artifact.kind], file_path, artifact.payload)
 
     return json_path
 
 
-def _save_py(content: str, suffix: str, directory: Path, name: str, timestamp: str) -> Path:
-    """Save Python code artifact."""
-    path_iter = generate_unique_save_name(str(directory), name, suffix, timestamp, "py")
-    file_path = next(path_iter)
-    file_path.write_text(content)
-    return file_path
+def wait_for_pending_saves() -> None:
+    """Block until all background writes have finished, re-raising the first error."""
+    with _pending_lock:
+        pending = list(_pending)
+        _pending.clear()
+    for future in pending:
+        future.result()
 
 
-def _save_figure(fig, suffix: str, directory: Path, name: str, timestamp: str) -> Path:
-    """Save matplotlib figure artifact."""
-    path_iter = generate_unique_save_name(str(directory), name, suffix, timestamp, "png")
-    file_path = next(path_iter)
-    save_fig(file_path, fig)
-    return file_path
+def _split_arrays(
+    data: dict[str, Any], ref: Callable[[str], str]
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Pull ndarray leaves out of nested dicts, replacing each with ref(npz key).
+
+    npz keys are the DELIMITER-joined dict path under an "arrays" prefix, which
+    keeps them clear of np.savez's own parameter names (file, allow_pickle).
+    """
+    arrays: dict[str, np.ndarray] = {}
+
+    def _walk(d: dict, prefix: str) -> dict:
+        out = {}
+        for k, v in d.items():
+            key = f"{prefix}{DELIMITER}{k}"
+            if isinstance(v, np.ndarray):
+                arrays[key] = v
+                out[k] = ref(key)
+            elif isinstance(v, dict):
+                out[k] = _walk(v, key)
+            else:
+                out[k] = v
+        return out
+
+    return _walk(data, "arrays"), arrays
+
+
+def _claim_path(directory: Path, stem: str, extension: str | None, background: bool) -> Path:
+    """make_save_path that also skips paths reserved by queued background writes.
+
+    With background=True the returned path is reserved until its write is done,
+    since the file only appears once the writer thread gets to it.
+    """
+    with _pending_lock:
+        path = make_save_path(directory, stem, extension)
+        if path in _reserved_paths:
+            candidates = generate_unique_save_name(directory, stem, extension)
+            path = next(
+                candidate
+                for candidate in candidates
+                if candidate not in _reserved_paths and not os.path.lexists(candidate)
+            )
+        if background:
+            _reserved_paths.add(path)
+    return path
+
+
+def _on_write_done(path: Path, future: Future) -> None:
+    error = future.exception()
+    with _pending_lock:
+        _reserved_paths.discard(path)
+        if error is None:
+            _pending.discard(future)
+    if error is not None:
+        # Report now; wait_for_pending_saves() re-raises it later
+        _logger.error("Background save of %s failed", path, exc_info=error)
+
+
+def _write(background: bool, path: Path, func: Callable, *args) -> None:
+    """Run a write to path now, or queue it on the background writer."""
+    if not background:
+        func(*args)
+        return
+
+    global _writer
+    with _pending_lock:
+        if _writer is None:
+            _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qutemplates-save")
+            atexit.register(wait_for_pending_saves)
+        future = _writer.submit(func, *args)
+        _pending.add(future)
+    # Outside the lock: the callback runs right away if the write already finished
+    future.add_done_callback(partial(_on_write_done, path))
 
 
 def save_py_by_dir_or_path_with_timestamp(path: Path | str, payload, name: str, extension: str):
@@ -1,6 +1,8 @@
+import io
 import json
+import os
 import pickle
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Iterator
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
@@ -43,8 +45,10 @@ class JsonEncoder(json.JSONEncoder):
 
 
 def json_save(path: Path, data):
+    # Encode fully before touching the file: an unserializable value must not
+    # leave a truncated *.json behind
     s = json.dumps(data, cls=JsonEncoder, indent=2)
-    path.write_text(s)
+    path.write_text(s, encoding="utf-8")
 
 
 def pickle_save(path, data_o):
@@ -57,67 +61,105 @@ DELIMITER = "__"
 
 
 def convert_to_iterable(d: Any) -> Iterable[Any]:
-    if not isinstance(d, Iterable):
-        d = [d]
-    else:
-        d = np.array(d, dtype=object).flatten()
-    return d
+    if not isinstance(d, Iterable) or isinstance(d, str):
+        return [d]
+    if isinstance(d, np.ndarray):
+        return d.ravel()  # view when possible
+    # Already flat sequences are returned as-is; only nested ones need numpy
+    if isinstance(d, (list, tuple)) and not any(isinstance(x, (list, tuple, np.ndarray)) for x in d):
+        return d
+    return np.array(d, dtype=object).flatten()
 
 
 def convert_to_canonical_dict(data: dict[str, Any]) -> dict[str, Any]:
-    def _helper():
-        for k, v in data.items():
-            if not isinstance(v, dict):
-                yield k, v
-            else:
-                v = convert_to_canonical_dict(v)
-                for new_k, new_v in v.items():
-                    yield DELIMITER.join([k, new_k]), new_v
-
-    return dict(_helper())
+    """Flatten nested dicts into {"a__b__c": value}, keeping depth-first key order."""
+    out: dict[str, Any] = {}
+    # Each entry is (key prefix, iterator over the remaining items at that level)
+    stack: list[tuple[str | None, Iterator]] = [(None, iter(data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            key = k if prefix is None else f"{prefix}{DELIMITER}{k}"
+            if isinstance(v, dict):
+                stack.append((key, iter(v.items())))
+                break
+            out[key] = v
+        else:
+            stack.pop()
+    return out
 
 
-def save_dict(path: Path, data: Any, save_format: str = "json"):
+def save_dict(path: Path, data: Any, save_format: str = "json", skip_check: bool = False):
     func = SAVE_FUNCTION_MAPPING[save_format]
-    validate_file_existence(path)
+    if not skip_check:
+        validate_file_existence(path)
     func(path, data)
 
 
-def save_array(path: str, data: dict[str, Iterable]):
+def save_array(path: str, data: dict[str, Iterable], compress: bool = False):
     # if the data is dict we want to flatten it
     canonical_data = convert_to_canonical_dict(data)
-    np.savez_compressed(f"{path}.npz", **canonical_data)
+    # measurement traces rarely deflate well, so skip zlib unless asked for
+    savez = np.savez_compressed if compress else np.savez
+    savez(f"{path}.npz", **canonical_data)
+
+
+def save_fig(path: Path, fig, tight: bool = True, skip_check: bool = False):
+    """tight=False skips the extra measuring render that bbox_inches="tight" needs."""
+    if not skip_check:
+        validate_file_existence(path)
+    with open(path, "wb", buffering=1 << 20) as f:
+        fig.savefig(f, format=path.suffix.lstrip(".") or None, bbox_inches="tight" if tight else None)
 
 
-def save_fig(path: Path, fig):
-    validate_file_existence(path)
-    fig.savefig(path, bbox_inches="tight")
+def render_fig(fig, fmt: str = "png", tight: bool = True) -> bytes:
+    """Render a figure to encoded bytes in memory (same output as save_fig)."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, bbox_inches="tight" if tight else None)
+    return buf.getvalue()
 
 
 def validate_file_existence(path: Path, raise_error=True):
     """returns whether validation is OK (true) and Not Ok (false)"""
-    if path.is_file() and raise_error:
+    # a single lstat - anything already at the path (file, dir, link) blocks the save
+    if raise_error and os.path.lexists(path):
         raise FileExistsError(f"Cannot save file at {path} as it already exists")
 
 
 def generate_unique_save_name(
-    path: str, name: str, suffix: str, saving_time: str, extension: str | None = None
+    directory: Path, stem: str, extension: str | None = None
 ) -> Generator[Path, None, None]:
     """
-    returns a generator which generates full path for a file with the format of {name}_{suffix}_{saving_time}.
+    returns a generator which generates full path for a file named {stem} inside directory.
     each time one apply 'next' operation on the generator the file name is incremented:
         e.g.:   next(gen) --> some_name_my_suffix_22022022.txt
                 next(gen) --> some_name_my_suffix_22022022_1.txt
     """
-    # create the path with format
-    file_path = f"{path}\\{name}_{suffix}_{saving_time}"
-    increment = 0
+    ext = f".{extension}" if extension else ""
+
+    yield directory / f"{stem}{ext}"
+    increment = 1
     while True:
-        incremented_file_path = f"{file_path}_{increment}" if increment > 0 else file_path
-        full_path = f"{incremented_file_path}.{extension}" if extension else incremented_file_path
-        yield Path(full_path)
+        yield directory / f"{stem}_{increment}{ext}"
         increment += 1
 
 
+def make_save_path(directory: Path, stem: str, extension: str | None = None) -> Path:
+    """
+    returns a full path for a file named {stem} inside directory that does not exist yet.
+    the plain name is returned directly in the common case; the incrementing
+    generate_unique_save_name is only consulted when that file already exists.
+    paths returned here can be written with skip_check=True.
+    """
+    ext = f".{extension}" if extension else ""
+    path = directory / f"{stem}{ext}"
+    if not os.path.lexists(path):
+        return path
+
+    candidates = generate_unique_save_name(directory, stem, extension)
+    next(candidates)  # the plain name, already taken
+    return next(candidate for candidate in candidates if not os.path.lexists(candidate))
+
+
 def add_time_stamp(path: Path) -> Path:
     return path.with_stem(f"{path.stem}_{time_stamp()}")
@@ -1,17 +1,29 @@
 """OPX-specific experiment implementation."""
 
-# Import new names
-from .handler import (
-    BaseOpxHandler,
-    CachingOpxHandler,
-    DefaultOpxHandler,
-    OPXContext,
-)
+from typing import TYPE_CHECKING
 
-# from .interactive import InteractiveOPX
-from .snapshot import SnapshotOPX  # BatchOPX is backward compatibility alias
+from ..common.lazy import lazy_module_attrs
 
-# from .streaming import StreamingOPX
+if TYPE_CHECKING:
+    from .context import OPXContext
+    from .handler import BaseOpxHandler, CachingOpxHandler, DefaultOpxHandler
+
+    # from .interactive import InteractiveOPX
+    from .snapshot import SnapshotOPX  # BatchOPX is backward compatibility alias
+
+    # from .streaming import StreamingOPX
+
+# Resolved lazily (PEP 562) so importing one submodule, e.g. the handlers, does
+# not drag in the snapshot workflow / plotting stack as well.
+_LAZY_IMPORTS = {
+    "SnapshotOPX": ".snapshot",
+    # "StreamingOPX": ".streaming",
+    # "InteractiveOPX": ".interactive",
+    "OPXContext": ".context",
+    "BaseOpxHandler": ".handler",
+    "CachingOpxHandler": ".handler",
+    "DefaultOpxHandler": ".handler",
+}
 
 __all__ = [
     "SnapshotOPX",
@@ -22,3 +34,5 @@ __all__ = [
     "CachingOpxHandler",
     "DefaultOpxHandler",
 ]
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_IMPORTS, __all__)
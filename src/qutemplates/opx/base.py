@@ -59,6 +59,11 @@ class BaseOPX(ABC):
             self.define_program()
         return prog
 
-    def create_qua_script(self) -> str:
-        """Generate QUA script string from the program."""
-        return self.opx_handler.generate_qua_script(self._build_program())
+    def create_qua_script(self, prog=None) -> str:
+        """Generate QUA script string from the program.
+
+        Pass an already built program to avoid running define_program() again.
+        """
+        if prog is None:
+            prog = self._build_program()
+        return self.opx_handler.generate_qua_script(prog)
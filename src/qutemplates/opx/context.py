@@ -1,14 +1,18 @@
 """OPX context and connection dataclasses."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from qm import QuantumMachine, QuantumMachinesManager, StreamsManager
-from qm.api.v2.job_api import JobApi
-from qm.api.v2.qm_api import QmApi
-from qm.jobs.running_qm_job import RunningQmJob
+if TYPE_CHECKING:
+    from qm import QuantumMachine, QuantumMachinesManager, StreamsManager
+    from qm.api.v2.job_api import JobApi
+    from qm.api.v2.qm_api import QmApi
+    from qm.jobs.running_qm_job import RunningQmJob
 
 
-@dataclass
+@dataclass(slots=True)
 class OPXManagerAndMachine:
     """Manager and machine pair returned by handler.open()."""
 
@@ -16,7 +20,7 @@ class OPXManagerAndMachine:
     machine: QuantumMachine | QmApi
 
 
-@dataclass
+@dataclass(slots=True)
 class OPXContext:
     """Execution context with job and result handles."""
 
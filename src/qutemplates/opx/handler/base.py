@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-
-from qm import FullQuaConfig
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
 from ..context import OPXContext
 from ..simulation import SimulationData
 
+if TYPE_CHECKING:
+    from qm import FullQuaConfig
+
 
 class BaseOpxHandler(ABC):
     """Abstract base class for OPX hardware handlers.
@@ -50,3 +54,12 @@ class BaseOpxHandler(ABC):
     @abstractmethod
     def generate_qua_script(self, program) -> str:
         pass
+
+    @contextmanager
+    def session(self) -> Iterator[BaseOpxHandler]:
+        """open() on enter and close() on exit, also when the body raises."""
+        self.open()
+        try:
+            yield self
+        finally:
+            self.close()
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from qm import FullQuaConfig, QuantumMachine, QuantumMachinesManager, generate_qua_script
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, ClassVar
 
 from ..context import OPXContext, OPXManagerAndMachine
 from ..simulation import SimulationData, simulate_program
 from .base import BaseOpxHandler
+from .config_hash import hash_config
+from .qmm_pool import QmmPool
+
+if TYPE_CHECKING:
+    from qm import FullQuaConfig, QuantumMachine, QuantumMachinesManager
 
 
 class CachingOpxHandler(BaseOpxHandler):
@@ -16,12 +23,20 @@ class CachingOpxHandler(BaseOpxHandler):
     Splits config into logical and physical parts, using the physical part
     for cache lookup.
 
-    Override _split_config() and _hash_config() to implement config handling.
+    Override _split_config() to implement config handling. _hash_config() has a
+    default content hash and only needs overriding for custom cache keys.
+
+    The machine cache is LRU and reference counted: once it holds more than
+    _cache_maxsize machines, the least recently opened ones that no open
+    handler holds are closed. Machines in use are never evicted.
     """
 
     # Class-level caches
-    _ip_to_manager: dict[str, QuantumMachinesManager] = {}
-    _cache: dict[tuple[str, str], QuantumMachine] = {}
+    _qmm_pool: ClassVar[QmmPool] = QmmPool()
+    _cache: ClassVar[OrderedDict[tuple[str, str], QuantumMachine]] = OrderedDict()
+    _refcounts: ClassVar[dict[tuple[str, str], int]] = {}
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    _cache_maxsize: ClassVar[int] = 8
 
     def __init__(
         self,
@@ -32,13 +47,15 @@ class CachingOpxHandler(BaseOpxHandler):
         """Initialize handler.
 
         Args:
-            close_on_close: If True, close() removes machine from cache.
+            close_on_close: If True, close() removes machine from cache (once
+                no other handler holds it).
         """
         self.opx_metadata = opx_metadata
         self.config = config
         self.close_on_close = close_on_close
         self._logical_config: dict | None = None
         self._physical_config: dict | None = None
+        self._execute_kwargs: dict = {}
         self._cache_key: tuple[str, str] | None = None
         self._manager_and_machine: OPXManagerAndMachine | None = None
 
@@ -47,18 +64,51 @@ class CachingOpxHandler(BaseOpxHandler):
         raise NotImplementedError("Subclass must implement _split_config()")
 
     def _hash_config(self, physical_config: dict) -> str:
-        """Hash physical config for cache key. Override in subclass."""
-        raise NotImplementedError("Subclass must implement _hash_config()")
+        """Hash physical config for cache key (BLAKE2 over key-sorted JSON)."""
+        return hash_config(physical_config)
+
+    @classmethod
+    def set_max_cached_machines(cls, maxsize: int) -> None:
+        """Set the machine cache size, closing the oldest idle machines beyond it."""
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        with cls._cache_lock:
+            # Set on the base class: the cache itself is shared by all subclasses
+            CachingOpxHandler._cache_maxsize = maxsize
+            evicted = cls._pop_idle(maxsize)
+        for machine in evicted:
+            machine.close()
+
+    @classmethod
+    def evict_all(cls) -> None:
+        """Close and forget all cached machines that no open handler holds."""
+        with cls._cache_lock:
+            evicted = cls._pop_idle(0)
+        for machine in evicted:
+            machine.close()
+
+    @classmethod
+    def _pop_idle(cls, maxsize: int) -> list[QuantumMachine]:
+        """Pop least recently opened idle machines until at most maxsize remain.
+
+        Call with _cache_lock held; the caller closes the returned machines.
+        """
+        evicted = []
+        for key in list(cls._cache):
+            if len(cls._cache) <= maxsize:
+                break
+            if key not in cls._refcounts:
+                evicted.append(cls._cache.pop(key))
+        return evicted
 
     def get_or_create_qmm(self) -> QuantumMachinesManager:
         """Get or create QMM for this IP. Shared across handlers."""
-        ip = self.opx_metadata.host_ip
-        if ip not in self._ip_to_manager:
-            self._ip_to_manager[ip] = self.create_qmm()
-        return self._ip_to_manager[ip]
+        return self._qmm_pool.get_or_create(self.opx_metadata.host_ip, self.create_qmm)
 
     def create_qmm(self) -> QuantumMachinesManager:
         """Create new QMM. Override to customize (e.g., add Octave config)."""
+        from qm import QuantumMachinesManager
+
         return QuantumMachinesManager(
             host=self.opx_metadata.host_ip,
             port=self.opx_metadata.port,
@@ -73,31 +123,41 @@ class CachingOpxHandler(BaseOpxHandler):
 
     def open(self):
         """Open or retrieve cached QuantumMachine based on config hash."""
+        # A repeated open() without close() must not leak the previous reference
+        self.close()
+
+        # Split on every open() so in-place edits to self.config are picked up
         self._logical_config, self._physical_config = self._split_config(self.config)
+        # Resolved once here rather than on every execute()
+        self._execute_kwargs = self._logical_config or {}
         config_hash = self._hash_config(self._physical_config)
         self._cache_key = (self.opx_metadata.host_ip, config_hash)
 
         qmm = self.get_or_create_qmm()
 
-        if self._cache_key in self._cache:
-            machine = self._cache[self._cache_key]
-        else:
-            machine = qmm.open_qm(self._physical_config, close_other_machines=False)
-            self._cache[self._cache_key] = machine
+        with self._cache_lock:
+            machine = self._cache.get(self._cache_key)
+            if machine is not None:
+                self._cache.move_to_end(self._cache_key)
+            else:
+                machine = qmm.open_qm(self._physical_config, close_other_machines=False)
+                self._cache[self._cache_key] = machine
+            self._refcounts[self._cache_key] = self._refcounts.get(self._cache_key, 0) + 1
+            # Only after open_qm succeeded, and never the machine just taken
+            evicted = self._pop_idle(self._cache_maxsize)
+        for oldest in evicted:
+            oldest.close()
 
         self._manager_and_machine = OPXManagerAndMachine(manager=qmm, machine=machine)
 
-    def _get_execute_kwargs(self) -> dict:
-        """Get kwargs for machine.execute() from logical config."""
-        return self._logical_config or {}
-
     def execute(self, program) -> OPXContext:
         """Execute program with logical config kwargs."""
         mm = self.manager_and_machine
-        job = mm.machine.execute(program, **self._get_execute_kwargs())
+        machine = mm.machine
+        job = machine.execute(program, **self._execute_kwargs)
         return OPXContext(
             manager=mm.manager,
-            qm=mm.machine,
+            qm=machine,
             job=job,
             result_handles=job.result_handles,
         )
@@ -116,18 +176,33 @@ class CachingOpxHandler(BaseOpxHandler):
             self._physical_config or self.config,
             program,
             duration_cycles,
-            flags or [],
+            flags,
             simulation_interface,
         )
 
     def close(self) -> None:
-        """Close machine if close_on_close is True, otherwise keep cached."""
-        if not self.close_on_close:
+        """Release the machine. With close_on_close, close it once no handler holds it."""
+        key = self._cache_key
+        if key is None or self._manager_and_machine is None:
             return
-
-        if self._cache_key and self._cache_key in self._cache:
-            machine = self._cache.pop(self._cache_key)
+        self._manager_and_machine = None
+
+        with self._cache_lock:
+            count = self._refcounts.get(key, 0) - 1
+            if count > 0:
+                self._refcounts[key] = count
+                return
+            self._refcounts.pop(key, None)
+            if self.close_on_close:
+                machine = self._cache.pop(key, None)
+                evicted = [] if machine is None else [machine]
+            else:
+                # Now idle, so it may be over the size limit
+                evicted = self._pop_idle(self._cache_maxsize)
+        for machine in evicted:
             machine.close()
 
     def generate_qua_script(self, program) -> str:
+        from qm import generate_qua_script
+
         return generate_qua_script(program, self.config)
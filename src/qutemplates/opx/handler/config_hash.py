@@ -0,0 +1,38 @@
+"""Content hash of QUA configs, used as machine cache keys by the handlers."""
+
+import hashlib
+import json
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional fast path, see the `fast` extra
+    orjson = None
+
+
+def _encode_value(obj):
+    """JSON stand-in for values the encoders do not handle natively.
+
+    Arrays are reduced to dtype + shape + a digest of their raw bytes, so two
+    configs hash equal only if their waveforms are bit-identical. Anything
+    unknown raises rather than falling back to a lossy repr.
+    """
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            return obj.tolist()
+        digest = hashlib.blake2b(np.ascontiguousarray(obj), digest_size=16).hexdigest()
+        return {"ndarray": digest, "dtype": obj.dtype.str, "shape": list(obj.shape)}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot hash config value of type {type(obj).__name__}")
+
+
+def hash_config(config: dict) -> str:
+    """Hash a config dict (BLAKE2 over key-sorted JSON)."""
+    if orjson is not None:
+        options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        encoded = orjson.dumps(config, default=_encode_value, option=options)
+    else:
+        encoded = json.dumps(config, sort_keys=True, default=_encode_value).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
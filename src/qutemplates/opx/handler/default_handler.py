@@ -2,25 +2,45 @@
 
 from __future__ import annotations
 
-from qm import FullQuaConfig, QuantumMachinesManager, generate_qua_script
+import threading
+from typing import TYPE_CHECKING, ClassVar
 
 from ..context import OPXContext, OPXManagerAndMachine
 from ..simulation import SimulationData, simulate_program
 from .base import BaseOpxHandler
+from .config_hash import hash_config
+from .qmm_pool import QmmPool
+
+if TYPE_CHECKING:
+    from qm import FullQuaConfig, QuantumMachine, QuantumMachinesManager
 
 
 class DefaultOpxHandler(BaseOpxHandler):
     """Default OPX handler with shared QMM per IP address.
 
     Caches QMM per IP to avoid reconnection overhead.
+    Handlers opening the same config on the same IP share one machine; it is
+    reference counted and closed when the last of them calls close().
     Override create_qmm() for custom manager creation (e.g., with Octave).
     """
 
-    _ip_to_manager: dict[str, QuantumMachinesManager] = {}
+    # Class-level caches, shared by all handlers
+    _qmm_pool: ClassVar[QmmPool] = QmmPool()
+    _machines: ClassVar[dict[tuple[str, str], QuantumMachine]] = {}
+    _refcounts: ClassVar[dict[tuple[str, str], int]] = {}
+    _machines_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, opx_metadata, config: FullQuaConfig, force_close_others: bool = False):
+        """Initialize handler.
 
-    def __init__(self, opx_metadata, config: FullQuaConfig):
+        Args:
+            force_close_others: If True, open() closes every other machine on the
+                QMM (close_other_machines=True), including ones held by other handlers.
+        """
         self.opx_metadata = opx_metadata
         self.config = config
+        self.force_close_others = force_close_others
+        self._machine_key: tuple[str, str] | None = None
         self._manager_and_machine: OPXManagerAndMachine | None = None
 
     @property
@@ -31,32 +51,63 @@ class DefaultOpxHandler(BaseOpxHandler):
 
     def get_or_create_qmm(self) -> QuantumMachinesManager:
         """Get or create QMM for this IP. Shared across handlers."""
-        ip = self.opx_metadata.host_ip
-        if ip not in self._ip_to_manager:
-            self._ip_to_manager[ip] = self.create_qmm()
-        return self._ip_to_manager[ip]
+        return self._qmm_pool.get_or_create(self.opx_metadata.host_ip, self.create_qmm)
 
     def create_qmm(self) -> QuantumMachinesManager:
         """Create new QMM. Override to customize (e.g., add Octave config)."""
+        from qm import QuantumMachinesManager
+
         return QuantumMachinesManager(
             host=self.opx_metadata.host_ip,
             port=self.opx_metadata.port,
             cluster_name=self.opx_metadata.cluster_name,
         )
 
+    def _config_key(self) -> str:
+        """Content hash of the config, or its identity if a value can't be hashed."""
+        try:
+            return hash_config(self.config)
+        except TypeError:
+            # Only this config object shares the machine; holders keep it alive,
+            # so the id cannot be reused while the entry exists
+            return f"id:{id(self.config)}"
+
     def open(self):
-        """Open QuantumMachine with stored configuration."""
+        """Open QuantumMachine with stored configuration, or share an open one."""
+        # A repeated open() without close() must not leak the previous reference
+        self.close()
+
         qmm = self.get_or_create_qmm()
-        qm = qmm.open_qm(self.config, close_other_machines=True)
+        host_ip = self.opx_metadata.host_ip
+
+        if self.force_close_others:
+            qm = qmm.open_qm(self.config, close_other_machines=True)
+            with self._machines_lock:
+                # Every other machine on this QMM was just closed
+                for key in [key for key in self._machines if key[0] == host_ip]:
+                    del self._machines[key]
+                    del self._refcounts[key]
+            self._machine_key = None
+        else:
+            key = (host_ip, self._config_key())
+            with self._machines_lock:
+                qm = self._machines.get(key)
+                if qm is None:
+                    qm = qmm.open_qm(self.config, close_other_machines=False)
+                    self._machines[key] = qm
+                self._refcounts[key] = self._refcounts.get(key, 0) + 1
+            self._machine_key = key
+
         self._manager_and_machine = OPXManagerAndMachine(manager=qmm, machine=qm)
 
     def execute(self, program) -> OPXContext:
         """Execute program and return context."""
         mm = self.manager_and_machine
-        job = mm.machine.execute(program)
+        machine = mm.machine
+        job = machine.execute(program)
         return OPXContext(
             manager=mm.manager,
-            qm=mm.machine,
+            qm=machine,
             job=job,
             result_handles=job.result_handles,
         )
@@ -75,15 +126,36 @@ class DefaultOpxHandler(BaseOpxHandler):
             self.config,
             program,
             duration_cycles,
-            flags or [],
+            flags,
             simulation_interface,
         )
 
     def close(self) -> None:
-        """Close the QuantumMachine."""
-        if self._manager_and_machine is not None:
-            self.manager_and_machine.machine.close()
-            self._manager_and_machine = None
+        """Release the QuantumMachine, closing it once no other handler uses it."""
+        if self._manager_and_machine is None:
+            return
+
+        machine = self._manager_and_machine.machine
+        key = self._machine_key
+        self._manager_and_machine = None
+        self._machine_key = None
+
+        if key is not None:
+            with self._machines_lock:
+                if self._machines.get(key) is not machine:
+                    # Dropped by a force_close_others open(), which already closed
+                    # it; the key may now belong to a newer machine
+                    return
+                count = self._refcounts[key] - 1
+                if count > 0:
+                    self._refcounts[key] = count
+                    return
+                del self._refcounts[key]
+                del self._machines[key]
+
+        machine.close()
 
     def generate_qua_script(self, program) -> str:
+        from qm import generate_qua_script
+
         return generate_qua_script(program, self.config)
@@ -0,0 +1,52 @@
+"""Thread-safe QuantumMachinesManager cache shared by handlers."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qm import QuantumMachinesManager
+
+
+class QmmPool:
+    """Cache of QuantumMachinesManager instances keyed by host IP.
+
+    Lookups of an existing manager take no lock; creation is serialized so
+    concurrent handlers for the same IP never open two managers.
+    Managers are kept until close_all() - machines opened through a manager
+    stay valid only while it is alive, so there is no eviction. close_all()
+    also runs at interpreter exit.
+    """
+
+    __slots__ = ("_lock", "_managers")
+
+    def __init__(self) -> None:
+        self._managers: dict[str, QuantumMachinesManager] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.close_all)
+
+    def get_or_create(
+        self, ip: str, factory: Callable[[], QuantumMachinesManager]
+    ) -> QuantumMachinesManager:
+        """Return the manager for ip, creating it with factory on first use."""
+        qmm = self._managers.get(ip)
+        if qmm is not None:
+            return qmm
+
+        with self._lock:
+            # Another thread may have created it while we waited
+            qmm = self._managers.get(ip)
+            if qmm is None:
+                qmm = self._managers[ip] = factory()
+        return qmm
+
+    def close_all(self) -> None:
+        """Close and forget all managers."""
+        with self._lock:
+            managers = list(self._managers.values())
+            self._managers.clear()
+        for qmm in managers:
+            qmm.close()
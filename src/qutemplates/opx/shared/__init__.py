@@ -1,11 +1,12 @@
 """Shared workflow components used across experiment types."""
 
-from .job_polling import create_job_polling
+from .job_polling import create_job_polling, wait_for_job
 from .progress import create_progress_bar
 from .live_animation import add_live_animation
 
 __all__ = [
     "create_job_polling",
+    "wait_for_job",
     "create_progress_bar",
     "add_live_animation",
 ]
@@ -1,3 +1,4 @@
+import time
 from functools import partial
 
 from quflow import ContextFuncTask, ParallelNode, PollingTask, TaskContext, Workflow
@@ -29,6 +30,19 @@ def check_job_is_running_and_set_interrupt(ctx: TaskContext, opx_ctx: OPXContext
         ctx.interrupt.set()
 
 
+def wait_for_job(opx_context: OPXContext, poll_interval_sec: float = 0.1) -> None:
+    """
+    Block until the OPX job stops processing, without a workflow.
+
+    Uses the same completion check as the job polling node, so a halted job
+    ends the wait too. Sleeps between checks on the calling thread, which
+    keeps the wait interruptible with Ctrl+C.
+    """
+    result_handles = opx_context.result_handles
+    while result_handles.is_processing():
+        time.sleep(poll_interval_sec)
+
+
 def create_job_polling(flow: Workflow, opx_context: OPXContext):
     """
     Add job status polling node to workflow.
@@ -6,8 +6,6 @@ updates to the data pipeline.
 
 from quflow import ParallelNode, Workflow, create_single_item_channel
 
-from qutemplates.common import LiveAnimationTask
-
 from ..averager import AveragerInterface
 from .node_names import OPXNodeName
 
@@ -18,6 +16,8 @@ def add_live_animation(
     setup_plot,
     update_plot,
     averager_interface: AveragerInterface | None = None,
+    refresh_time_sec: float = 0.05,
+    blit: bool = False,
 ) -> ParallelNode:
     """
     Add live animation node to workflow.
@@ -30,6 +30,10 @@ def add_live_animation(
         flow: Workflow to add node to
         data_source_node: Node that produces data for plotting (typically POST node)
         interface: Experiment interface with setup_plot and update_plot
+        refresh_time_sec: Seconds between animation frames. Larger values mean
+            fewer update_plot calls and redraws for slow, heavy plots.
+        blit: Redraw only the artists returned by update_plot each frame.
+            Requires fixed axis limits (no autoscaling in update_plot).
 
     Returns:
         Created live animation node
@@ -44,7 +48,9 @@ def add_live_animation(
         Requires matplotlib and runs in main thread. The setup_plot and update_plot
         callables must be provided in the interface.
     """
-    #
+    # Imported here so matplotlib is only loaded by strategies that plot
+    from qutemplates.common import LiveAnimationTask
+
     if averager_interface:
         get_current_average = averager_interface.get_current_average
         max_avg = averager_interface.total
@@ -56,7 +62,8 @@ def add_live_animation(
     live_anim_task = LiveAnimationTask(
         setup_func=setup_plot,
         update=update_plot,
-        refresh_time_sec=0.05,
+        refresh_time_sec=refresh_time_sec,
+        blit=blit,
         current_avg_callable=get_current_average,
         max_avg=max_avg,
     )
@@ -1,10 +1,13 @@
 """QUA program simulation."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from qm import CompilerOptionArguments, FullQuaConfig, QuantumMachinesManager, SimulationConfig
-from qm import SimulatorSamples
-from qm.waveform_report import WaveformReport
+if TYPE_CHECKING:
+    from qm import FullQuaConfig, QuantumMachinesManager, SimulatorSamples
+    from qm.waveform_report import WaveformReport
 
 
 @dataclass
@@ -41,6 +44,8 @@ def simulate_program(
     Returns:
         SimulationData containing samples and waveform report
     """
+    from qm import CompilerOptionArguments, SimulationConfig
+
     job = qmm.simulate(
         config=config,
         program=program,
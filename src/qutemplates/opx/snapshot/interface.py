@@ -1,19 +1,22 @@
 # Snapshot experiment interface for workflow construction
 
+from __future__ import annotations
+
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
-
-from matplotlib.artist import Artist
-from matplotlib.figure import Figure
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from ..averager import AveragerInterface
 from ..handler import OPXContext
 
+if TYPE_CHECKING:
+    from matplotlib.artist import Artist
+    from matplotlib.figure import Figure
+
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LivePlottingInterface:
     """
     Interface for live plotting capabilities.
@@ -25,9 +28,12 @@ class LivePlottingInterface:
     setup_plot: Callable[[], tuple[Figure, list[Artist]] | None]
     update_plot: Callable[[list[Artist], Any], list[Artist]]
     averager_interface: AveragerInterface | None
+    refresh_time_sec: float = 0.05
+    blit: bool = False
 
 
-@dataclass
+# Not frozen: frozen + slots breaks SnapshotInterface[T](...) instantiation
+@dataclass(slots=True)
 class SnapshotInterface(Generic[T]):
     """Interface for snapshot workflow - framework polls fetch_results periodically."""
 
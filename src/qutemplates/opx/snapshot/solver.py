@@ -2,12 +2,16 @@
 Snapshot strategy solver - builds workflows for SnapshotOPX experiments.
 
 Strategies:
-- 'wait_for_all': Only job polling (minimal)
+- 'wait_for_all': No workflow - execute() blocks on the job (minimal)
 - 'wait_for_progress': Job polling + progress bar
 - 'live_plotting': Job polling + data acquisition + live animation
 - 'live_plotting_with_progress': All features (full-featured)
+
+Strategies differ only in which optional features run alongside the job, so a
+strategy is just a set of StrategyFeature flags fed to one builder.
 """
 
+from enum import IntFlag, auto
 from typing import Literal
 
 from quflow import Workflow
@@ -26,6 +30,14 @@ SnapshotStrategy = Literal[
 ]
 
 
+class StrategyFeature(IntFlag):
+    """Optional workflow features on top of job polling."""
+
+    NONE = 0
+    PROGRESS = auto()  # tqdm progress bar driven by the averager
+    LIVE_PLOTTING = auto()  # FETCH -> POST pipeline + live animation
+
+
 def solve_strategy(strategy: SnapshotStrategy, interface: SnapshotInterface) -> Workflow:
     """
     Solve snapshot strategy and return workflow.
@@ -38,126 +50,95 @@ def solve_strategy(strategy: SnapshotStrategy, interface: SnapshotInterface) ->
         Configured workflow
 
     Raises:
-        ValueError: If strategy name not found
+        ValueError: If strategy name not found, or the experiment lacks what
+            the strategy needs (averager for progress, plot hooks for live plotting)
 
     Example:
         >>> interface = SnapshotInterface(...)
         >>> workflow = solve_strategy('live_plotting_with_progress', interface)
         >>> workflow.execute()
     """
-    builder = STRATEGY_REGISTRY.get(strategy)
-
-    if builder is None:
-        available = list(STRATEGY_REGISTRY.keys())
-        raise ValueError(f"Unknown snapshot strategy: '{strategy}'. Available: {available}")
-
-    return builder(interface)
-
-
-# Strategy builder functions
+    features = resolve_strategy(
+        strategy,
+        averaging=interface.averager_interface is not None,
+        live_plotting=interface.live_plotting is not None,
+    )
+    return build_workflow(features, interface)
 
 
-def build_wait_for_all(interface: SnapshotInterface) -> Workflow:
+def resolve_strategy(strategy: str, averaging: bool, live_plotting: bool) -> StrategyFeature:
     """
-    wait_for_all: Only job polling (no data acquisition during workflow).
+    Look up the features of a strategy and check the experiment supports them.
 
-    Minimal workflow - just waits for OPX job completion.
-    Template will do final fetch/post after workflow.
-    """
-    flow = Workflow()
-    create_job_polling(flow, interface.opx_context)
-    return flow
+    Needs no job or interface, so templates call it before starting the program.
 
+    Args:
+        strategy: Strategy name
+        averaging: Whether the experiment uses an Averager
+        live_plotting: Whether the experiment implements setup_plot/update_plot
 
-def build_wait_for_progress(interface: SnapshotInterface) -> Workflow:
+    Raises:
+        ValueError: If strategy name not found, or a requested feature is not
+            supported by the experiment
     """
-    wait_for_progress: Job polling + progress bar.
+    features = STRATEGY_REGISTRY.get(strategy)
 
-    Shows progress during execution but no live data updates.
+    if features is None:
+        available = list(STRATEGY_REGISTRY.keys())
+        raise ValueError(f"Unknown snapshot strategy: '{strategy}'. Available: {available}")
 
-    Raises:
-        ValueError: If averager_interface is None (progress requires averaging)
-    """
-    if interface.averager_interface is None:
+    if StrategyFeature.LIVE_PLOTTING in features and not live_plotting:
         raise ValueError(
-            "Strategy 'wait_for_progress' requires averaging to be enabled. "
-            "Use an Averager in your experiment or choose a different strategy."
+            f"Strategy '{strategy}' requires setup_plot() and update_plot() "
+            "to be implemented in your experiment class."
         )
 
-    flow = Workflow()
-    create_job_polling(flow, interface.opx_context)
-    create_progress_bar(flow, interface.averager_interface)
-    return flow
-
-
-def build_live_plotting(interface: SnapshotInterface) -> Workflow:
-    """
-    live_plotting: Job polling + data acquisition + live animation.
-
-    Full data pipeline with live updates but no progress bar.
-
-    Raises:
-        ValueError: If live_plotting interface is None (methods not implemented)
-    """
-    if interface.live_plotting is None:
+    if StrategyFeature.PROGRESS in features and not averaging:
         raise ValueError(
-            "Strategy 'live_plotting' requires setup_plot() and update_plot() "
-            "to be implemented in your experiment class."
+            f"Strategy '{strategy}' requires averaging to be enabled. "
+            "Use an Averager in your experiment or choose a different strategy."
         )
 
-    flow = Workflow()
-    post_node = create_fetch_post_skeleton(flow, interface)
-    create_job_polling(flow, interface.opx_context)
-    add_live_animation(
-        flow,
-        post_node,
-        interface.live_plotting.setup_plot,
-        interface.live_plotting.update_plot,
-        interface.live_plotting.averager_interface,
-    )
-    return flow
+    return features
 
 
-def build_live_plotting_with_progress(interface: SnapshotInterface) -> Workflow:
+def build_workflow(features: StrategyFeature, interface: SnapshotInterface) -> Workflow:
     """
-    live_plotting_with_progress: All features.
+    Build the workflow for a set of features already checked by resolve_strategy().
 
-    Complete feature set: data pipeline, job polling, progress, live plots.
-    This is the full-featured/standard strategy.
-
-    Raises:
-        ValueError: If live_plotting or averager_interface is None
+    Job polling is added whenever there is a feature; it sets the interrupt
+    that stops the other polling nodes when the OPX job finishes. With no
+    features the workflow is left empty and the template waits on the job
+    itself, without spawning any node threads. Template will do final
+    fetch/post after workflow.
     """
-    if interface.live_plotting is None:
-        raise ValueError(
-            "Strategy 'live_plotting_with_progress' requires setup_plot() and update_plot() "
-            "to be implemented in your experiment class."
-        )
-
-    if interface.averager_interface is None:
-        raise ValueError(
-            "Strategy 'live_plotting_with_progress' requires averaging to be enabled. "
-            "Use an Averager in your experiment."
-        )
-
+    live_plotting = interface.live_plotting
     flow = Workflow()
-    post_node = create_fetch_post_skeleton(flow, interface)
+    if not features:
+        return flow
+
+    if StrategyFeature.LIVE_PLOTTING in features:
+        post_node = create_fetch_post_skeleton(flow, interface)
     create_job_polling(flow, interface.opx_context)
-    create_progress_bar(flow, interface.averager_interface)
-    add_live_animation(
-        flow,
-        post_node,
-        interface.live_plotting.setup_plot,
-        interface.live_plotting.update_plot,
-        interface.live_plotting.averager_interface,
-    )
+    if StrategyFeature.PROGRESS in features:
+        create_progress_bar(flow, interface.averager_interface)
+    if StrategyFeature.LIVE_PLOTTING in features:
+        add_live_animation(
+            flow,
+            post_node,
+            live_plotting.setup_plot,
+            live_plotting.update_plot,
+            live_plotting.averager_interface,
+            live_plotting.refresh_time_sec,
+            live_plotting.blit,
+        )
     return flow
 
 
-# Registry mapping strategy names to builders
-STRATEGY_REGISTRY = {
-    "wait_for_all": build_wait_for_all,
-    "wait_for_progress": build_wait_for_progress,
-    "live_plotting": build_live_plotting,
-    "live_plotting_with_progress": build_live_plotting_with_progress,
+# Registry mapping strategy names to their features
+STRATEGY_REGISTRY: dict[str, StrategyFeature] = {
+    "wait_for_all": StrategyFeature.NONE,
+    "wait_for_progress": StrategyFeature.PROGRESS,
+    "live_plotting": StrategyFeature.LIVE_PLOTTING,
+    "live_plotting_with_progress": StrategyFeature.PROGRESS | StrategyFeature.LIVE_PLOTTING,
 }
@@ -4,22 +4,24 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from pathlib import Path
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-import matplotlib.pyplot as plt
-from matplotlib.artist import Artist
-from matplotlib.figure import Figure
 from quflow import Status
 
 from qutemplates.export import ArtifactKind, ArtifactRegistry, save
 
 from ..averager import Averager, AveragerInterface
 from ..base import BaseOPX
+from ..shared import wait_for_job
 from ..simulation import SimulationData
 from ..utils import ns_to_clock_cycles
 from .constants import ExportConstants
 from .interface import LivePlottingInterface, SnapshotInterface
-from .solver import SnapshotStrategy, solve_strategy
+from .solver import SnapshotStrategy, build_workflow, resolve_strategy
+
+if TYPE_CHECKING:
+    from matplotlib.artist import Artist
+    from matplotlib.figure import Figure
 
 T = TypeVar("T")
 
@@ -34,12 +36,25 @@ class SnapshotOPX(BaseOPX, Generic[T]):
     live_plotting_with_progress (default).
     """
 
+    # Whether the subclass overrides both setup_plot and update_plot; resolved
+    # once per class in __init_subclass__
+    _has_live_plotting: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._has_live_plotting = (
+            cls.setup_plot is not SnapshotOPX.setup_plot
+            and cls.update_plot is not SnapshotOPX.update_plot
+        )
+
     def __init__(self) -> None:
         super().__init__()
         self.name = ""
         self.data: Any = None
         self.parameters: Any = None
         self.status: Status = Status.PENDING
+        self.plot_refresh_sec: float = 0.05
+        self.plot_blit: bool = False
         self._registry = ArtifactRegistry()
         self._averager: Averager | None = None
         self._averager_interface: AveragerInterface | None = None
@@ -102,40 +117,50 @@ class SnapshotOPX(BaseOPX, Generic[T]):
         self.artifacts.register(ExportConstants.PARAMETERS, self.parameters)
         self.pre_run()
 
+        # Build the program and its script once; both are reused below
+        prog = self._build_program()
+        qua_script = self.create_qua_script(prog)
+
         if debug_script_path:
-            save.save_py_by_dir_or_path_with_timestamp(
-                debug_script_path, self.create_qua_script(), "debug", "py"
-            )
+            save.save_py_by_dir_or_path_with_timestamp(debug_script_path, qua_script, "debug", "py")
 
-        self.artifacts.register(
-            ExportConstants.QUA_SCRIPT, self.create_qua_script(), kind=ArtifactKind.PY
+        self.artifacts.register(ExportConstants.QUA_SCRIPT, qua_script, kind=ArtifactKind.PY)
+
+        # Check the strategy before anything runs on hardware
+        features = resolve_strategy(
+            strategy,
+            averaging=self._averager is not None,
+            live_plotting=self._has_live_plotting,
         )
 
-        # Explicit lifecycle: open -> execute -> workflow -> close
-        self.opx_handler.open()
-        prog = self._build_program()
-        self.opx_context = self.opx_handler.execute(prog)
+        # Explicit lifecycle: open -> execute -> workflow -> close (also on error)
+        with self.opx_handler.session() as handler:
+            context = self.opx_context = handler.execute(prog)
+
+            # Build averager interface if averager was used
+            if self._averager is not None:
+                self._averager_interface = self._averager.generate_interface(context.result_handles)
 
-        # Build averager interface if averager was used
-        if self._averager is not None:
-            self._averager_interface = self.averager.generate_interface(self.opx_context.result_handles)
+            # Build and execute workflow
+            interface = self._create_interface()
+            workflow = build_workflow(features, interface)
 
-        # Build and execute workflow
-        interface = self._create_interface()
-        workflow = solve_strategy(strategy, interface)
+            if workflow.empty:
+                # Nothing runs alongside the job (wait_for_all) - just block on it
+                wait_for_job(context)
+            else:
+                if show_execution_graph:
+                    import matplotlib.pyplot as plt
 
-        if not workflow.empty:
-            if show_execution_graph:
-                workflow.visualize()
-                plt.show()
-            workflow.execute()
-            self.status = workflow.status
+                    workflow.visualize()
+                    plt.show()
+                workflow.execute()
+                self.status = workflow.status
 
-        # Final fetch, process, and close
-        raw_data = self.fetch_results()
-        self.data = self.post_run(raw_data)
-        self.artifacts.register(ExportConstants.DATA, self.data)
-        self.opx_handler.close()
+            # Final fetch and process
+            raw_data = self.fetch_results()
+            self.data = self.post_run(raw_data)
+            self.artifacts.register(ExportConstants.DATA, self.data)
 
         if self.status is Status.RUNNING:
             self.status = Status.FINISHED
@@ -171,27 +196,28 @@ class SnapshotOPX(BaseOPX, Generic[T]):
             flags.append("not-strict-timing")
 
         # Explicit lifecycle: open -> simulate -> close
-        self.opx_handler.open()
-        try:
+        with self.opx_handler.session() as handler:
             prog = self._build_program()
             duration_cycles = ns_to_clock_cycles(duration_ns)
-            data = self.opx_handler.simulate(prog, duration_cycles, flags, simulation_interface)
-        finally:
-            self.opx_handler.close()
+            data = handler.simulate(prog, duration_cycles, flags, simulation_interface)
 
         if debug_path:
             with open(debug_path, "w") as f:
-                f.write(self.create_qua_script())
+                f.write(self.create_qua_script(prog))
 
         return data
 
     def _create_interface(self) -> SnapshotInterface:
         """Create snapshot interface with all required components."""
-        live_plotting_interface = LivePlottingInterface(
-            setup_plot=self.setup_plot,
-            update_plot=self.update_plot,
-            averager_interface=self._averager_interface,
-        )
+        live_plotting_interface = None
+        if self._has_live_plotting:
+            live_plotting_interface = LivePlottingInterface(
+                setup_plot=self.setup_plot,
+                update_plot=self.update_plot,
+                averager_interface=self._averager_interface,
+                refresh_time_sec=self.plot_refresh_sec,
+                blit=self.plot_blit,
+            )
 
         return SnapshotInterface(
             fetch_results=self.fetch_results,